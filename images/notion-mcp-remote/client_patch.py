@@ -1,13 +1,27 @@
 """Per-request NotionClient injection via ContextVar.
 
 Monkey-patches get_client() in notion_mcp.server and all 6 tool modules
-so each authenticated request gets its own NotionClient with the user's
-Notion access token.
+so each authenticated request gets the NotionClient for the user's
+Notion access token. Clients are pooled per token (LRU-bounded, with a
+TTL) so repeat requests reuse the same client and its connection pool
+instead of building a new one every time. Pooled clients are shared
+across concurrent requests and must hold no per-request state. Evicted
+and expired clients are only dropped from the pool, not closed, because
+an in-flight request or a stateful MCP session may still hold them; GC
+reclaims them once the last user lets go. Clients still pooled at exit
+are closed. The TTL bounds how long the pool keeps a client for a
+revoked or rotated token.
 """
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
+import importlib
+from collections import OrderedDict
 from contextvars import ContextVar
+from time import monotonic
 
 from notion_sdk import NotionClient
 
@@ -15,6 +29,20 @@ _request_client: ContextVar[NotionClient | None] = ContextVar(
     "_request_client", default=None
 )
 
+_PATCHED_MODULES = (
+    "notion_mcp.server",
+    "notion_mcp.tools.blocks",
+    "notion_mcp.tools.comments",
+    "notion_mcp.tools.databases",
+    "notion_mcp.tools.pages",
+    "notion_mcp.tools.search",
+    "notion_mcp.tools.users",
+)
+
+_POOL_MAX = 256
+_POOL_TTL = 3600.0  # seconds
+_CLIENT_POOL: OrderedDict[bytes, tuple[NotionClient, float]] = OrderedDict()
+
 
 def patched_get_client() -> NotionClient:
     """Return the per-request NotionClient set by the OAuth flow."""
@@ -32,28 +60,37 @@ def set_client_for_request(api_key: str) -> None:
     Called by mcp-remote-auth's load_access_token on every request, so the
     contextvar is always set to the correct user's client before tool execution.
     """
+    _request_client.set(_get_pooled_client(api_key))
+
+
+def _get_pooled_client(api_key: str) -> NotionClient:
+    """Return the pooled NotionClient for api_key, creating it on a miss."""
+    key = hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+    now = monotonic()
+    entry = _CLIENT_POOL.get(key)
+    if entry is not None:
+        client, created = entry
+        if now - created < _POOL_TTL:
+            _CLIENT_POOL.move_to_end(key)
+            return client
+        del _CLIENT_POOL[key]
     client = NotionClient(api_key=api_key)
-    _request_client.set(client)
+    _CLIENT_POOL[key] = (client, now)
+    if len(_CLIENT_POOL) > _POOL_MAX:
+        _CLIENT_POOL.popitem(last=False)
+    return client
+
+
+@atexit.register
+def _close_pool() -> None:
+    """Close every pooled NotionClient's HTTP connections."""
+    while _CLIENT_POOL:
+        _, (client, _) = _CLIENT_POOL.popitem()
+        client.close()
 
 
+@functools.cache
 def apply_patch() -> None:
     """Replace get_client in notion_mcp.server and all tool modules."""
-    import notion_mcp.server
-    import notion_mcp.tools.blocks
-    import notion_mcp.tools.comments
-    import notion_mcp.tools.databases
-    import notion_mcp.tools.pages
-    import notion_mcp.tools.search
-    import notion_mcp.tools.users
-
-    notion_mcp.server.get_client = patched_get_client
-
-    for mod in [
-        notion_mcp.tools.blocks,
-        notion_mcp.tools.comments,
-        notion_mcp.tools.databases,
-        notion_mcp.tools.pages,
-        notion_mcp.tools.search,
-        notion_mcp.tools.users,
-    ]:
-        mod.get_client = patched_get_client
+    for name in _PATCHED_MODULES:
+        importlib.import_module(name).get_client = patched_get_client
@@ -4,13 +4,25 @@ and serves it over Streamable HTTP using mcp-remote-auth.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 
-from dotenv import load_dotenv
+# Kubernetes injects the environment directly; .env is only read for local
+# runs with MCP_USE_DOTENV=1.
+if os.environ.get("MCP_USE_DOTENV") == "1":
+    from dotenv import load_dotenv
 
-load_dotenv()
+    load_dotenv()
+elif "NOTION_OAUTH_CLIENT_ID" not in os.environ:
+    # Same lookup load_dotenv() would use, so the hint matches what it reads.
+    from dotenv import find_dotenv
+
+    if find_dotenv():
+        sys.exit("Found .env but did not load it; set MCP_USE_DOTENV=1 to read it.")
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -24,7 +36,25 @@ HOST = os.environ.get("HOST", "127.0.0.1")
 PORT = int(os.environ.get("PORT", "8000"))
 ONBOARD_SECRET = os.environ.get("ONBOARD_SECRET", "")
 
-logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+# Records are formatted on the calling thread and handed to a bounded queue;
+# a background listener thread does the actual stderr writes. When the queue
+# is full (e.g. a log storm), new records are dropped rather than blocking.
+_LOG_QUEUE_MAX = 10000
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+_log_queue: queue.Queue = queue.Queue(maxsize=_LOG_QUEUE_MAX)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stderr))
+logging.basicConfig(level=logging.INFO, handlers=[_DroppingQueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -113,7 +143,12 @@ def main():
 
     logger.info("Starting notion-mcp-remote on %s:%d", HOST, PORT)
     app = build_app_with_middleware(mcp, use_body_inspection=False)
-    uvicorn.run(app, host=HOST, port=PORT)
+    uvicorn.run(
+        app,
+        host=HOST,
+        port=PORT,
+        server_header=False,
+    )
 
 
 if __name__ == "__main__":